@@ -137,9 +137,7 @@ class CustomSoundManager: ObservableObject {
             return .success(newFilename)
         }
 
-        if FileManager.default.fileExists(atPath: destinationURL.path) {
-            try? FileManager.default.removeItem(at: destinationURL)
-        }
+        try? FileManager.default.removeItem(at: destinationURL)
 
         do {
             try FileManager.default.copyItem(at: sourceURL, to: destinationURL)
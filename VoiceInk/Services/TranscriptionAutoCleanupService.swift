@@ -112,8 +112,7 @@ class TranscriptionAutoCleanupService {
             var deletedCount = 0
             for transcription in items {
                 if let urlString = transcription.audioFileURL,
-                   let url = URL(string: urlString),
-                   FileManager.default.fileExists(atPath: url.path) {
+                   let url = URL(string: urlString) {
                     try? FileManager.default.removeItem(at: url)
                 }
                 backgroundContext.delete(transcription)
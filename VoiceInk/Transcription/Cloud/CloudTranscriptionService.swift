@@ -43,15 +43,12 @@ class CloudTranscriptionService: TranscriptionService {
     }
 
     func transcribe(audioURL: URL, model: any TranscriptionModel) async throws -> String {
-        let audioData = try loadAudioData(from: audioURL)
-        let fileName = audioURL.lastPathComponent
-        let language = selectedLanguage()
-
         do {
             if model.provider == .custom {
                 guard let customModel = model as? CustomCloudModel else {
                     throw CloudTranscriptionError.unsupportedProvider
                 }
+                // Reads the file itself while building the upload, so skip loading it here
                 return try await openAICompatibleService.transcribe(audioURL: audioURL, model: customModel)
             }
 
@@ -59,12 +56,13 @@ class CloudTranscriptionService: TranscriptionService {
                 throw CloudTranscriptionError.unsupportedProvider
             }
             let apiKey = try requireAPIKey(forProvider: cloudProvider.providerKey)
+            let audioData = try loadAudioData(from: audioURL)
             return try await cloudProvider.transcribe(
                 audioData: audioData,
-                fileName: fileName,
+                fileName: audioURL.lastPathComponent,
                 apiKey: apiKey,
                 model: model.name,
-                language: language,
+                language: selectedLanguage(),
                 prompt: transcriptionPrompt(),
                 customVocabulary: getCustomDictionaryTerms()
             )
@@ -83,7 +81,13 @@ class CloudTranscriptionService: TranscriptionService {
         guard FileManager.default.fileExists(atPath: url.path) else {
             throw CloudTranscriptionError.audioFileNotFound
         }
-        return try Data(contentsOf: url)
+        // Map the recording instead of copying it onto the heap; pages load on demand during upload
+        // Read failures are reported as a missing file so they are not mistaken for network errors
+        do {
+            return try Data(contentsOf: url, options: .mappedIfSafe)
+        } catch {
+            throw CloudTranscriptionError.audioFileNotFound
+        }
     }
 
     private func requireAPIKey(forProvider provider: String) throws -> String {
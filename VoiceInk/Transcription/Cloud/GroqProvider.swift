@@ -7,6 +7,7 @@ struct GroqProvider: CloudProvider {
     let providerKey: String = "Groq"
     let languageCodes: [String]? = nil
     let includesAutoDetect: Bool = false
+    private let baseURL = URL(string: "https://api.groq.com/openai")!
 
     var models: [CloudModel] {[
         CloudModel(
@@ -23,7 +24,7 @@ struct GroqProvider: CloudProvider {
 
     func transcribe(audioData: Data, fileName: String, apiKey: String, model: String, language: String?, prompt: String?, customVocabulary: [String]) async throws -> String {
         return try await OpenAITranscriptionClient.transcribe(
-            baseURL: URL(string: "https://api.groq.com/openai")!,
+            baseURL: baseURL,
             audioData: audioData,
             fileName: fileName,
             apiKey: apiKey,
@@ -37,7 +38,7 @@ struct GroqProvider: CloudProvider {
 
     func verifyAPIKey(_ key: String) async -> (isValid: Bool, errorMessage: String?) {
         return await OpenAITranscriptionClient.verifyAPIKey(
-            baseURL: URL(string: "https://api.groq.com/openai")!,
+            baseURL: baseURL,
             apiKey: key
         )
     }
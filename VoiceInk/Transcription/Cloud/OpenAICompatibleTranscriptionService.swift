@@ -1,6 +1,17 @@
 import Foundation
 
 class OpenAICompatibleTranscriptionService {
+    // App-owned so the launch sweep never touches other processes' files in the shared $TMPDIR
+    private static let spoolDirectory = FileManager.default.temporaryDirectory
+        .appendingPathComponent("com.prakashjoshipax.VoiceInk", isDirectory: true)
+        .appendingPathComponent("UploadSpools", isDirectory: true)
+
+    /// Removes upload spools left behind if the app exited mid-upload.
+    /// Each spool holds a full copy of a recording, so none should outlive the request.
+    static func removeStaleUploadSpools() {
+        try? FileManager.default.removeItem(at: spoolDirectory)
+    }
+
     func transcribe(audioURL: URL, model: CustomCloudModel) async throws -> String {
         guard let url = URL(string: model.apiEndpoint) else {
             throw NSError(domain: "CustomWhisperTranscriptionService", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid API endpoint URL"])
@@ -12,8 +23,10 @@ class OpenAICompatibleTranscriptionService {
         request.setValue("multipart/form-data; boundary=\(boundary)", forHTTPHeaderField: "Content-Type")
         request.setValue("Bearer \(model.apiKey)", forHTTPHeaderField: "Authorization")
 
-        let body = try buildRequestBody(audioURL: audioURL, modelName: model.modelName, boundary: boundary)
-        let (data, response) = try await URLSession.shared.upload(for: request, from: body)
+        // Spool the multipart body to disk so the audio is never held in memory
+        let bodyURL = try buildRequestBody(audioURL: audioURL, modelName: model.modelName, boundary: boundary)
+        defer { try? FileManager.default.removeItem(at: bodyURL) }
+        let (data, response) = try await URLSession.shared.upload(for: request, fromFile: bodyURL)
 
         guard let httpResponse = response as? HTTPURLResponse else {
             throw CloudTranscriptionError.networkError(URLError(.badServerResponse))
@@ -31,30 +44,43 @@ class OpenAICompatibleTranscriptionService {
         }
     }
 
-    private func buildRequestBody(audioURL: URL, modelName: String, boundary: String) throws -> Data {
-        guard let audioData = try? Data(contentsOf: audioURL) else {
+    private func buildRequestBody(audioURL: URL, modelName: String, boundary: String) throws -> URL {
+        guard let audioHandle = try? FileHandle(forReadingFrom: audioURL) else {
             throw CloudTranscriptionError.audioFileNotFound
         }
+        defer { try? audioHandle.close() }
+
+        let bodyURL = Self.spoolDirectory.appendingPathComponent(UUID().uuidString)
+        do {
+            try FileManager.default.createDirectory(at: Self.spoolDirectory, withIntermediateDirectories: true)
+        } catch {
+            throw CloudTranscriptionError.dataEncodingError
+        }
+        guard FileManager.default.createFile(atPath: bodyURL.path, contents: nil) else {
+            throw CloudTranscriptionError.dataEncodingError
+        }
+        guard let bodyHandle = try? FileHandle(forWritingTo: bodyURL) else {
+            try? FileManager.default.removeItem(at: bodyURL)
+            throw CloudTranscriptionError.dataEncodingError
+        }
+        defer { try? bodyHandle.close() }
 
         let selectedLanguage = UserDefaults.standard.string(forKey: "SelectedLanguage") ?? "auto"
         let prompt = UserDefaults.standard.string(forKey: "TranscriptionPrompt") ?? ""
         let crlf = "\r\n"
-        var body = Data()
 
-        func append(_ string: String) { body.append(string.data(using: .utf8)!) }
+        // Framing is assembled up front and written as one prologue and one epilogue around the chunked audio copy
+        let prologue = "--\(boundary)\(crlf)"
+            + "Content-Disposition: form-data; name=\"file\"; filename=\"\(audioURL.lastPathComponent)\"\(crlf)"
+            + "Content-Type: audio/wav\(crlf)\(crlf)"
+
+        var epilogue = crlf
         func field(_ name: String, _ value: String) {
-            append("--\(boundary)\(crlf)")
-            append("Content-Disposition: form-data; name=\"\(name)\"\(crlf)\(crlf)")
-            body.append(value.data(using: .utf8)!)
-            append(crlf)
+            epilogue += "--\(boundary)\(crlf)"
+            epilogue += "Content-Disposition: form-data; name=\"\(name)\"\(crlf)\(crlf)"
+            epilogue += value + crlf
         }
 
-        append("--\(boundary)\(crlf)")
-        append("Content-Disposition: form-data; name=\"file\"; filename=\"\(audioURL.lastPathComponent)\"\(crlf)")
-        append("Content-Type: audio/wav\(crlf)\(crlf)")
-        body.append(audioData)
-        append(crlf)
-
         field("model", modelName)
         field("response_format", "json")
         field("temperature", "0")
@@ -66,8 +92,29 @@ class OpenAICompatibleTranscriptionService {
             field("prompt", prompt)
         }
 
-        append("--\(boundary)--\(crlf)")
-        return body
+        epilogue += "--\(boundary)--\(crlf)"
+
+        do {
+            try bodyHandle.write(contentsOf: Data(prologue.utf8))
+            while true {
+                let chunk: Data?
+                do {
+                    chunk = try audioHandle.read(upToCount: 1 << 16)
+                } catch {
+                    throw CloudTranscriptionError.audioFileNotFound
+                }
+                guard let chunk, !chunk.isEmpty else { break }
+                try bodyHandle.write(contentsOf: chunk)
+            }
+            try bodyHandle.write(contentsOf: Data(epilogue.utf8))
+        } catch let error as CloudTranscriptionError {
+            try? FileManager.default.removeItem(at: bodyURL)
+            throw error
+        } catch {
+            try? FileManager.default.removeItem(at: bodyURL)
+            throw CloudTranscriptionError.dataEncodingError
+        }
+        return bodyURL
     }
 
     private struct TranscriptionResponse: Decodable {
@@ -126,7 +126,7 @@ class FluidAudioTranscriptionService: TranscriptionService {
 
     private func readAudioSamples(from url: URL) throws -> [Float] {
         do {
-            let data = try Data(contentsOf: url)
+            let data = try Data(contentsOf: url, options: .mappedIfSafe)
             guard data.count > 44 else {
                 throw ASRError.invalidAudioData
             }
@@ -300,9 +300,7 @@ class WhisperModelManager: ObservableObject {
                 try? FileManager.default.removeItem(at: coreMLURL)
             } else {
                 let coreMLDir = modelsDirectory.appendingPathComponent("\(model.name)-encoder.mlmodelc")
-                if FileManager.default.fileExists(atPath: coreMLDir.path) {
-                    try? FileManager.default.removeItem(at: coreMLDir)
-                }
+                try? FileManager.default.removeItem(at: coreMLDir)
             }
 
             availableModels.removeAll { $0.id == model.id }
@@ -80,7 +80,7 @@ class WhisperTranscriptionService: TranscriptionService {
     }
 
     private func readAudioSamples(_ url: URL) throws -> [Float] {
-        let data = try Data(contentsOf: url)
+        let data = try Data(contentsOf: url, options: .mappedIfSafe)
         let floats = stride(from: 44, to: data.count, by: 2).map {
             return data[$0..<$0 + 2].withUnsafeBytes {
                 let short = Int16(littleEndian: $0.load(as: Int16.self))
@@ -39,6 +39,8 @@ struct VoiceInkApp: App {
     init() {
         // Disable HTTP response caching — prevents API responses from being stored in Cache.db
         URLCache.shared = URLCache(memoryCapacity: 0, diskCapacity: 0)
+        // Remove any upload spool left behind if the previous session exited mid-upload
+        OpenAICompatibleTranscriptionService.removeStaleUploadSpools()
 
         AppDefaults.registerDefaults()
 